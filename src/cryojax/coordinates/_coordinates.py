@@ -82,7 +82,7 @@ class CoordinateGrid(AbstractCoordinates, strict=True):
     def __init__(
         self,
         shape: tuple[int, ...],
-        grid_spacing: float | Float[np.ndarray, ""] = 1.0,
+        grid_spacing: float | Float[np.ndarray, ""] | Float[Array, ""] = 1.0,
     ):
         self.array = make_coordinates(shape, grid_spacing)
 
@@ -104,7 +104,7 @@ class FrequencyGrid(AbstractCoordinates, strict=True):
     def __init__(
         self,
         shape: tuple[int, ...],
-        grid_spacing: float | Float[np.ndarray, ""] = 1.0,
+        grid_spacing: float | Float[np.ndarray, ""] | Float[Array, ""] = 1.0,
         half_space: bool = True,
     ):
         self.array = make_frequencies(shape, grid_spacing, half_space=half_space)
@@ -152,7 +152,8 @@ class FrequencySlice(AbstractCoordinates, strict=True):
 
 
 def make_coordinates(
-    shape: tuple[int, ...], grid_spacing: float | Float[np.ndarray, ""] = 1.0
+    shape: tuple[int, ...],
+    grid_spacing: float | Float[np.ndarray, ""] | Float[Array, ""] = 1.0,
 ) -> Float[Array, "*shape ndim"]:
     """
     Create a real-space cartesian coordinate system on a grid.
@@ -178,7 +179,7 @@ def make_coordinates(
 
 def make_frequencies(
     shape: tuple[int, ...],
-    grid_spacing: float | Float[np.ndarray, ""] = 1.0,
+    grid_spacing: float | Float[np.ndarray, ""] | Float[Array, ""] = 1.0,
     half_space: bool = True,
 ) -> Float[Array, "*shape ndim"]:
     """
@@ -237,11 +238,21 @@ def cartesian_to_polar(
 
 def _make_coordinates_or_frequencies(
     shape: tuple[int, ...],
-    grid_spacing: float | Float[np.ndarray, ""] = 1.0,
+    grid_spacing: float | Float[np.ndarray, ""] | Float[Array, ""] = 1.0,
     real_space: bool = False,
     half_space: bool = True,
 ) -> Float[Array, "*shape ndim"]:
+    # The one-dimensional axes are built with numpy, since they only depend on
+    # static information. The grid is then assembled from the axes with jax,
+    # so under a JIT transformation only the one-dimensional axes are embedded
+    # as constants, rather than the full grid. If the grid spacing is a JAX
+    # array, only the axes are rescaled at runtime.
     ndim = len(shape)
+    if ndim not in [2, 3]:
+        raise ValueError(
+            "Only 2D and 3D coordinate grids are supported. "
+            f"Tried to create a grid of shape {shape}."
+        )
     coords1D = []
     for idx in range(ndim):
         if real_space:
@@ -257,42 +268,36 @@ def _make_coordinates_or_frequencies(
                 shape[idx], grid_spacing, real_space, rfftfreq
             )
         coords1D.append(c1D)
-    if ndim == 2:
-        y, x = coords1D
-        xv, yv = jnp.meshgrid(x, y, indexing="xy")
-        coords = jnp.stack([xv, yv], axis=-1)
-    elif ndim == 3:
-        z, y, x = coords1D
-        xv, yv, zv = jnp.meshgrid(x, y, z, indexing="xy")
-        xv, yv, zv = [
-            jnp.transpose(rv, axes=[2, 0, 1]) for rv in [xv, yv, zv]
-        ]  # Change axis ordering to [z, y, x]
-        coords = jnp.stack([xv, yv, zv], axis=-1)
-    else:
-        raise ValueError(
-            "Only 2D and 3D coordinate grids are supported. "
-            f"Tried to create a grid of shape {shape}."
-        )
+    # Broadcast axes, given in [z, y, x] order, and stack in [x, y, z] order
+    grid_shape = tuple(c1D.shape[0] for c1D in coords1D)
+    coords = jnp.stack(
+        [
+            jnp.broadcast_to(
+                jnp.reshape(c1D, [-1 if i == idx else 1 for i in range(ndim)]),
+                grid_shape,
+            )
+            for idx, c1D in enumerate(coords1D)
+        ][::-1],
+        axis=-1,
+    )
 
     return coords
 
 
 def _make_coordinates_or_frequencies_1d(
     size: int,
-    grid_spacing: float | Float[np.ndarray, ""],
+    grid_spacing: float | Float[np.ndarray, ""] | Float[Array, ""],
     real_space: bool = False,
     rfftfreq: Optional[bool] = None,
-) -> Float[Array, " size"]:
+) -> Float[np.ndarray, " size"] | Float[Array, " size"]:
     """One-dimensional coordinates in real or fourier space"""
     if real_space:
-        make_1d = (
-            lambda size, dx: jnp.fft.fftshift(jnp.fft.fftfreq(size, 1 / dx)) * size
-        )
+        make_1d = lambda size, dx: np.fft.fftshift(np.fft.fftfreq(size)) * size * dx
     else:
         if rfftfreq is None:
             raise ValueError("Argument rfftfreq cannot be None if real_space=False.")
         else:
-            fn = jnp.fft.rfftfreq if rfftfreq else jnp.fft.fftfreq
-            make_1d = lambda size, dx: fn(size, grid_spacing)
+            fn = np.fft.rfftfreq if rfftfreq else np.fft.fftfreq
+            make_1d = lambda size, dx: fn(size) / dx
 
     return make_1d(size, grid_spacing)
@@ -92,12 +92,15 @@ def radial_average(
     bins = jnp.asarray(bins)
     # Discretize the radial grid
     digitized_radial_grid = jnp.digitize(radial_grid, bins, right=True)
-    # Compute the radial profile as the average value of the image in each bin
-    average_as_profile = jnp.bincount(
-        digitized_radial_grid.ravel(),
-        weights=image.ravel(),
-        length=bins.size,
-    ) / jnp.bincount(digitized_radial_grid.ravel(), length=bins.size)
+    # Compute the radial profile as the average value of the image in each bin.
+    # ... sum the image and count the pixels in each bin with a single
+    # scatter-add, indexing with the unflattened grid of bin indices
+    sums_and_counts = (
+        jnp.zeros((bins.size, 2), dtype=image.dtype)
+        .at[digitized_radial_grid]
+        .add(jnp.stack([image, jnp.ones_like(image)], axis=-1), mode="drop")
+    )
+    average_as_profile = sums_and_counts[:, 0] / sums_and_counts[:, 1].real
     # Interpolate to a grid or return the profile
     if to_grid:
         if interpolation_mode == "nearest":
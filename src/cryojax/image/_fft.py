@@ -5,6 +5,7 @@ Routines to compute FFTs, in cryojax conventions.
 from typing import Any, Optional, overload
 
 import jax.numpy as jnp
+import numpy as np
 from jaxtyping import Array, Complex, Float, Inexact
 
 
@@ -139,7 +140,19 @@ def irfftn(
     ift :
         Inverse fourier transform.
     """
-    ift = jnp.fft.fftshift(jnp.fft.irfftn(ft, s=s, axes=axes, **kwargs), axes=axes)
+    # Absorb the fftshift into a phase ramp on the half-space, rather
+    # than shifting the full real-space array
+    if axes is None:
+        axes = tuple(range(ft.ndim)) if s is None else tuple(range(-len(s), 0))
+    if s is None:
+        s = tuple(ft.shape[axis] for axis in axes[:-1]) + (
+            2 * (ft.shape[axes[-1]] - 1),
+        )
+    if tuple(ft.shape[axis] for axis in axes[:-1]) == tuple(s[:-1]):
+        ft = _apply_centering_phase(ft, s, axes, sign=-1)
+        ift = jnp.fft.irfftn(ft, s=s, axes=axes, **kwargs)
+    else:
+        ift = jnp.fft.fftshift(jnp.fft.irfftn(ft, s=s, axes=axes, **kwargs), axes=axes)
 
     return ift
 
@@ -179,6 +192,39 @@ def rfftn(
     ft :
         Fourier transform of array.
     """
-    ft = jnp.fft.rfftn(jnp.fft.ifftshift(ift, axes=axes), axes=axes, **kwargs)
+    # Absorb the ifftshift into a phase ramp on the half-space, rather
+    # than shifting the full real-space array
+    if "s" in kwargs:
+        ft = jnp.fft.rfftn(jnp.fft.ifftshift(ift, axes=axes), axes=axes, **kwargs)
+    else:
+        axes = tuple(range(ift.ndim)) if axes is None else axes
+        ft = jnp.fft.rfftn(ift, axes=axes, **kwargs)
+        ft = _apply_centering_phase(
+            ft, tuple(ift.shape[axis] for axis in axes), axes, sign=1
+        )
+
+    return ft
+
+
+def _apply_centering_phase(
+    ft: Inexact[Array, "..."],
+    s: tuple[int, ...],
+    axes: tuple[int, ...],
+    sign: int,
+) -> Complex[Array, "..."]:
+    """Multiply a half-space fourier transform by the phase ramp equivalent to
+    an ``ifftshift`` (``sign = 1``) or an ``fftshift`` (``sign = -1``) in real
+    space. The ramp is applied as a sequence of one-dimensional broadcasts, which
+    for even sizes reduce to alternating signs.
+    """
+    ft = jnp.asarray(ft, dtype=jnp.result_type(ft, 1j))
+    for axis, size in zip(axes, s):
+        k = np.arange(ft.shape[axis])
+        if size % 2 == 0:
+            phase = np.where(k % 2 == 0, 1.0, -1.0)
+        else:
+            phase = np.exp(sign * 2.0j * np.pi * k * (size // 2) / size)
+        broadcast_shape = [-1 if i == axis % ft.ndim else 1 for i in range(ft.ndim)]
+        ft = ft * jnp.asarray(phase.reshape(broadcast_shape), dtype=ft.dtype)
 
     return ft
@@ -2,12 +2,15 @@
 Routines for rescaling image pixel size.
 """
 
+from functools import partial
+
 import jax
 import jax.numpy as jnp
 from jax.image import scale_and_translate
 from jaxtyping import Array, Float
 
 
+@partial(jax.jit, static_argnames=["method", "antialias"])
 def rescale_pixel_size(
     image: Float[Array, "y_dim x_dim"],
     current_pixel_size: Float[Array, ""],
@@ -18,6 +21,9 @@ def rescale_pixel_size(
     """
     Measure an image at a given pixel size using interpolation.
 
+    The image shape, ``method``, and ``antialias`` are static, so a single
+    compiled resampler is reused across all images of the same shape.
+
     For more detail, see ``cryojax.utils.interpolation.scale``.
 
     Parameters
@@ -30,7 +36,9 @@ def rescale_pixel_size(
         The new pixel size after interpolation.
     method :
         Interpolation method. See ``jax.image.scale_and_translate``
-        for documentation.
+        for documentation. For ``"lanczos3"`` and ``"lanczos5"`` without
+        anti-aliasing, the kernel taps are applied directly rather than
+        through dense resampling matrices.
     antialias :
         Apply an anti-aliasing filter upon downsampling. See
         ``jax.image.scale_and_translate`` for documentation.
@@ -51,6 +59,16 @@ def rescale_pixel_size(
     N1, N2 = image.shape
     translation = (1 - scaling) * jnp.array([N1 // 2, N2 // 2], dtype=float)
     # Rescale pixel sizes
+    if method in _LANCZOS_RADII and not antialias:
+        # Without anti-aliasing, the kernel support is a fixed number of
+        # taps, so apply it directly along each axis
+        radius = _LANCZOS_RADII[method]
+        rescaled_image = image
+        for axis in (0, 1):
+            rescaled_image = _resample_axis_with_lanczos_taps(
+                rescaled_image, axis, scaling[axis], translation[axis], radius
+            )
+        return rescaled_image
     rescaled_image = scale_and_translate(
         image,
         image.shape,
@@ -63,3 +81,61 @@ def rescale_pixel_size(
     )
 
     return rescaled_image
+
+
+_LANCZOS_RADII = {"lanczos3": 3, "lanczos5": 5}
+
+
+def _evaluate_lanczos_kernel(
+    x: Float[Array, "..."], radius: int
+) -> Float[Array, "..."]:
+    """Evaluate the lanczos kernel at distance ``|x|`` from its center."""
+    x = jnp.abs(x)
+    y = radius * jnp.sin(jnp.pi * x) * jnp.sin(jnp.pi * x / radius)
+    kernel = jnp.where(x > 1e-3, y / jnp.where(x != 0, jnp.pi**2 * x**2, 1.0), 1.0)
+    return jnp.where(x > radius, 0.0, kernel)
+
+
+def _resample_axis_with_lanczos_taps(
+    image: Float[Array, "y_dim x_dim"],
+    axis: int,
+    scale: Float[Array, ""],
+    translation: Float[Array, ""],
+    radius: int,
+) -> Float[Array, "y_dim x_dim"]:
+    """Resample one axis of an image with the ``2 * radius + 1`` lanczos taps
+    nearest to each sample location, following the conventions of
+    ``jax.image.scale_and_translate``.
+    """
+    image = jnp.moveaxis(image, axis, 0)
+    size = image.shape[0]
+    # Sample locations in the input, in units of pixels
+    sample_locations = (jnp.arange(size) + 0.5 - translation) / scale - 0.5
+    # Indices and weights of the taps around each sample location
+    offsets = jnp.arange(-radius, radius + 1)
+    indices = jnp.floor(sample_locations).astype(int)[:, None] + offsets[None, :]
+    is_in_bounds = jnp.logical_and(indices >= 0, indices < size)
+    weights = jnp.where(
+        is_in_bounds,
+        _evaluate_lanczos_kernel(sample_locations[:, None] - indices, radius),
+        0.0,
+    )
+    # Normalize the weights, zeroing samples with vanishing total weight or
+    # that lie outside of the input
+    total_weight = jnp.sum(weights, axis=1, keepdims=True)
+    weights = jnp.where(
+        jnp.abs(total_weight) > 1000.0 * jnp.finfo(jnp.float32).eps,
+        weights / jnp.where(total_weight != 0, total_weight, 1.0),
+        0.0,
+    )
+    is_sampled = jnp.logical_and(
+        sample_locations >= -0.5, sample_locations <= size - 0.5
+    )
+    weights = jnp.where(is_sampled[:, None], weights, 0.0).astype(image.dtype)
+    # Gather the taps and contract with the weights
+    taps = image[jnp.clip(indices, 0, size - 1)]
+    resampled_image = jnp.einsum(
+        "ij,ij...->i...", weights, taps, precision=jax.lax.Precision.HIGHEST
+    )
+
+    return jnp.moveaxis(resampled_image, 0, axis)
@@ -43,20 +43,13 @@ class ImageConfig(Module, strict=True):
     - `rescale_method`:
         The interpolation method for pixel size rescaling. See
         ``jax.image.scale_and_translate`` for options.
-    - `wrapped_frequency_grid_in_pixels`:
-        The fourier wavevectors in the imaging plane, wrapped in
-        a `FrequencyGrid` object.
-    - `wrapped_padded_frequency_grid_in_pixels`:
-        The fourier wavevectors in the imaging plane
-        in the padded coordinate system, wrapped in
-        a `FrequencyGrid` object.
-    - `wrapped_coordinate_grid_in_pixels`:
-        The coordinates in the imaging plane, wrapped
-        in a `CoordinateGrid` object.
-    - `wrapped_padded_coordinate_grid_in_pixels`:
-        The coordinates in the imaging plane
-        in the padded coordinate system, wrapped in a
-        `CoordinateGrid` object.
+
+    !!! info
+        The coordinate and frequency grids of an `ImageConfig` (e.g.
+        `ImageConfig.wrapped_frequency_grid_in_pixels`) are not stored
+        as pytree leaves. They only depend on the static `shape` and
+        `padded_shape`, so they are built with `numpy` upon access. Under
+        a JIT transformation, this means they are compile-time constants.
     """
 
     shape: tuple[int, int] = field(static=True)
@@ -66,11 +59,6 @@ class ImageConfig(Module, strict=True):
     pad_mode: Union[str, Callable] = field(static=True)
     rescale_method: str = field(static=True)
 
-    wrapped_frequency_grid_in_pixels: FrequencyGrid
-    wrapped_padded_frequency_grid_in_pixels: FrequencyGrid
-    wrapped_coordinate_grid_in_pixels: CoordinateGrid
-    wrapped_padded_coordinate_grid_in_pixels: CoordinateGrid
-
     def __init__(
         self,
         shape: tuple[int, int],
@@ -97,15 +85,6 @@ class ImageConfig(Module, strict=True):
             self.padded_shape = (int(pad_scale * shape[0]), int(pad_scale * shape[1]))
         else:
             self.padded_shape = padded_shape
-        # Set coordinates
-        self.wrapped_frequency_grid_in_pixels = FrequencyGrid(shape=self.shape)
-        self.wrapped_padded_frequency_grid_in_pixels = FrequencyGrid(
-            shape=self.padded_shape
-        )
-        self.wrapped_coordinate_grid_in_pixels = CoordinateGrid(shape=self.shape)
-        self.wrapped_padded_coordinate_grid_in_pixels = CoordinateGrid(
-            shape=self.padded_shape
-        )
 
     def __check_init__(self):
         if self.padded_shape[0] < self.shape[0] or self.padded_shape[1] < self.shape[1]:
@@ -114,21 +93,59 @@ class ImageConfig(Module, strict=True):
                 "more dimensions."
             )
 
+    @cached_property
+    def wrapped_coordinate_grid_in_pixels(self) -> CoordinateGrid:
+        """The coordinates in the imaging plane, wrapped
+        in a `CoordinateGrid` object.
+        """
+        return CoordinateGrid(shape=self.shape)
+
+    @cached_property
+    def wrapped_frequency_grid_in_pixels(self) -> FrequencyGrid:
+        """The fourier wavevectors in the imaging plane, wrapped in
+        a `FrequencyGrid` object.
+        """
+        return FrequencyGrid(shape=self.shape)
+
+    @cached_property
+    def wrapped_padded_coordinate_grid_in_pixels(self) -> CoordinateGrid:
+        """The coordinates in the imaging plane
+        in the padded coordinate system, wrapped in a
+        `CoordinateGrid` object.
+        """
+        return CoordinateGrid(shape=self.padded_shape)
+
+    @cached_property
+    def wrapped_padded_frequency_grid_in_pixels(self) -> FrequencyGrid:
+        """The fourier wavevectors in the imaging plane
+        in the padded coordinate system, wrapped in
+        a `FrequencyGrid` object.
+        """
+        return FrequencyGrid(shape=self.padded_shape)
+
     @cached_property
     def wrapped_coordinate_grid_in_angstroms(self) -> CoordinateGrid:
-        return self.pixel_size * self.wrapped_coordinate_grid_in_pixels  # type: ignore
+        """The `wrapped_coordinate_grid_in_pixels` in angstroms. The
+        `pixel_size` rescales the grid axes before they are broadcast.
+        """
+        return CoordinateGrid(shape=self.shape, grid_spacing=self.pixel_size)
 
     @cached_property
     def wrapped_frequency_grid_in_angstroms(self) -> FrequencyGrid:
-        return self.wrapped_frequency_grid_in_pixels / self.pixel_size
+        """The `wrapped_frequency_grid_in_pixels` in angstroms. The
+        `pixel_size` rescales the grid axes before they are broadcast.
+        """
+        return FrequencyGrid(shape=self.shape, grid_spacing=self.pixel_size)
 
     @cached_property
     def wrapped_padded_coordinate_grid_in_angstroms(self) -> CoordinateGrid:
-        return self.pixel_size * self.wrapped_padded_coordinate_grid_in_pixels  # type: ignore
+        """The `wrapped_padded_coordinate_grid_in_pixels` in angstroms."""
+        return CoordinateGrid(shape=self.padded_shape, grid_spacing=self.pixel_size)
 
     @cached_property
     def wrapped_padded_frequency_grid_in_angstroms(self) -> FrequencyGrid:
-        return self.wrapped_padded_frequency_grid_in_pixels / self.pixel_size
+        """The `wrapped_padded_frequency_grid_in_pixels` in angstroms."""
+        return FrequencyGrid(shape=self.padded_shape, grid_spacing=self.pixel_size)
 
     def rescale_to_pixel_size(
         self,
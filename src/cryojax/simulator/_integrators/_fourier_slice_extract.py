@@ -4,6 +4,7 @@ Using the fourier slice theorem for computing volume projections.
 
 from typing import Any
 
+import equinox as eqx
 import jax.numpy as jnp
 from equinox import field
 from jaxtyping import Array, Complex, Float
@@ -47,6 +48,7 @@ class FourierSliceExtract(AbstractPotentialIntegrator, strict=True):
     interpolation_mode: str = field(static=True, default="fill")
     interpolation_cval: complex = field(static=True, default=0.0 + 0.0j)
 
+    @eqx.filter_jit
     def __call__(
         self,
         potential: FourierVoxelGridPotential | FourierVoxelGridPotentialInterpolator,
@@ -124,19 +126,17 @@ def extract_slice(
     projection : shape `(N, N//2+1)`
         The output image in fourier space.
     """
-    # Convert to logical coordinates
+    # Convert to logical coordinates, with the zero frequency component
+    # in the corner
     N = frequency_slice.shape[1]
-    logical_frequency_slice = (frequency_slice * N) + N // 2
-    # Convert arguments to map_coordinates convention and compute
-    k_z, k_y, k_x = jnp.transpose(logical_frequency_slice, axes=[3, 0, 1, 2])
+    k_x, k_y, k_z = _get_logical_frequency_slice(frequency_slice)
+    # Compute in the map_coordinates convention
     projection = map_coordinates(
-        fourier_voxel_grid, (k_x, k_y, k_z), interpolation_order, **kwargs
-    )[0, :, :]
-    # Shift zero frequency component to corner and take upper half plane
-    projection = jnp.fft.ifftshift(projection)[:, : N // 2 + 1]
+        fourier_voxel_grid, (k_z, k_y, k_x), interpolation_order, **kwargs
+    )
     # Set last line of frequencies to zero if image dimension is even
     if N % 2 == 0:
-        projection = projection.at[:, -1].set(0.0 + 0.0j).at[N // 2, :].set(0.0 + 0.0j)
+        projection = jnp.pad(projection, ((0, 0), (0, 1))).at[N // 2, :].set(0.0 + 0.0j)
     return projection
 
 
@@ -165,15 +165,30 @@ def extract_slice_with_cubic_spline(
     projection : shape `(N, N//2+1)`
         The output image in fourier space.
     """
-    # Convert to logical coordinates
+    # Convert to logical coordinates, with the zero frequency component
+    # in the corner
     N = frequency_slice.shape[1]
-    logical_frequency_slice = (frequency_slice * N) + N // 2
-    # Convert arguments to map_coordinates convention and compute
-    k_z, k_y, k_x = jnp.transpose(logical_frequency_slice, axes=[3, 0, 1, 2])
+    k_x, k_y, k_z = _get_logical_frequency_slice(frequency_slice)
+    # Compute in the map_coordinates convention
     projection = map_coordinates_with_cubic_spline(
-        spline_coefficients, (k_x, k_y, k_z), **kwargs
-    )[0, :, :]
-    # Shift zero frequency component to corner and take upper half plane
-    projection = jnp.fft.ifftshift(projection)[:, : N // 2 + 1]
+        spline_coefficients, (k_z, k_y, k_x), **kwargs
+    )
     # Set last line of frequencies to zero if image dimension is even
-    return projection if N % 2 == 1 else projection.at[:, -1].set(0.0 + 0.0j)
+    return projection if N % 2 == 1 else jnp.pad(projection, ((0, 0), (0, 1)))
+
+
+def _get_logical_frequency_slice(
+    frequency_slice: Float[Array, "1 dim dim 3"],
+) -> tuple[Float[Array, "dim _"], ...]:
+    """Convert the half of the slice that is kept in the upper half plane
+    to logical coordinates, one component at a time.
+
+    Rather than shifting the zero frequency component of the projection to
+    the corner after interpolation, the rows of the coordinates are shifted
+    before. This way, the slice is never transposed or copied as a whole.
+    """
+    N = frequency_slice.shape[1]
+    return tuple(
+        jnp.fft.ifftshift(frequency_slice[0, :, N // 2 :, i], axes=(0,)) * N + N // 2
+        for i in range(3)
+    )
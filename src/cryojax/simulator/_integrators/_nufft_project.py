@@ -3,7 +3,10 @@ Using non-uniform FFTs for computing volume projections.
 """
 
 import math
+from functools import partial
 
+import equinox as eqx
+import jax
 import jax.numpy as jnp
 from equinox import field
 from jaxtyping import Array, Complex, Float
@@ -25,6 +28,7 @@ class NufftProject(AbstractPotentialIntegrator, strict=True):
 
     eps: float = field(static=True, default=1e-6)
 
+    @eqx.filter_jit
     def __call__(
         self,
         potential: RealVoxelGridPotential | RealVoxelCloudPotential,
@@ -59,26 +63,35 @@ class NufftProject(AbstractPotentialIntegrator, strict=True):
         )
 
 
+@partial(jax.jit, static_argnames=["shape", "eps"])
 def project_with_nufft(
-    weights: Float[Array, " size"],
-    coordinate_list: Float[Array, "size 2"] | Float[Array, "size 3"],
+    weights: Float[Array, "*#batch size"],
+    coordinate_list: Float[Array, "*#batch size 2"] | Float[Array, "*#batch size 3"],
     shape: tuple[int, int],
     eps: float = 1e-6,
-) -> Complex[Array, "{shape[0]} {shape[1]}"]:
+) -> Complex[Array, "*batch {shape[0]} {shape[1]//2+1}"]:
     """
     Project and interpolate 3D volume point cloud
     onto imaging plane using a non-uniform FFT.
 
+    Leading batch dimensions (for example, a stack of orientations of
+    the same point cloud) are computed with a single batched transform,
+    rather than a transform per point cloud. The batch dimensions of
+    ``weights`` and ``coordinates`` broadcast, so a single coordinate
+    system may be shared by a batch of weights.
+
     Arguments
     ---------
-    weights : shape `(N,)`
+    weights : shape `(..., N)`
         Density point cloud.
-    coordinates : shape `(N, 2)` or shape `(N, 3)`
+    coordinates : shape `(..., N, 2)` or shape `(..., N, 3)`
         Coordinate system of point cloud.
     shape :
         Shape of the imaging plane in pixels.
         ``width, height = shape[0], shape[1]``
         is the size of the desired imaging plane.
+    eps :
+        See ``jax-finufft`` for documentation.
 
     Returns
     -------
@@ -92,19 +105,19 @@ def project_with_nufft(
         jnp.asarray(coordinate_list),
     )
     # Get x and y coordinates
-    coordinates_xy = coordinate_list[:, :2]
+    coordinates_xy = coordinate_list[..., :2]
     # Normalize coordinates betweeen -pi and pi
     M1, M2 = shape
     image_size = jnp.asarray((M1, M2), dtype=float)
     coordinates_periodic = 2 * jnp.pi * coordinates_xy / image_size
     # Unpack and compute
-    x, y = coordinates_periodic[:, 0], coordinates_periodic[:, 1]
+    x, y = coordinates_periodic[..., 0], coordinates_periodic[..., 1]
     projection = nufft1(shape, weights, y, x, eps=eps, iflag=-1)
     # Shift zero frequency component to corner and take upper half plane
-    projection = jnp.fft.ifftshift(projection)[:, : M2 // 2 + 1]
+    projection = jnp.fft.ifftshift(projection, axes=(-2, -1))[..., :, : M2 // 2 + 1]
     # Set last line of frequencies to zero if image dimension is even
     if M2 % 2 == 0:
-        projection = projection.at[:, -1].set(0.0 + 0.0j)
+        projection = projection.at[..., :, -1].set(0.0 + 0.0j)
     if M1 % 2 == 0:
-        projection = projection.at[M1 // 2, :].set(0.0 + 0.0j)
+        projection = projection.at[..., M1 // 2, :].set(0.0 + 0.0j)
     return projection
@@ -3,7 +3,7 @@ Voxel-based representations of the scattering potential.
 """
 
 from abc import abstractmethod
-from functools import cached_property
+from functools import cached_property, partial
 from typing import (
     Any,
     cast,
@@ -18,7 +18,7 @@ import jax
 import jax.numpy as jnp
 import numpy as np
 from equinox import AbstractClassVar, AbstractVar, field
-from jaxtyping import Array, Complex, Float, Int
+from jaxtyping import Array, Complex, Float, Inexact, Int
 
 from ...constants import get_form_factor_params
 from ...coordinates import CoordinateGrid, CoordinateList, FrequencySlice
@@ -150,13 +150,31 @@ class AbstractFourierVoxelGridPotential(AbstractVoxelPotential, strict=True):
         # Load potential and coordinates. For now, do not store the
         # fourier potential only on the half space. Fourier slice extraction
         # does not currently work if rfftn is used.
-        fourier_voxel_grid_with_zero_in_corner = (
-            fftn(padded_real_voxel_grid)
-            if filter is None
-            else filter(fftn(padded_real_voxel_grid))
-        )
-        # ... store the potential grid with the zero frequency component in the center
-        fourier_voxel_grid = jnp.fft.fftshift(fourier_voxel_grid_with_zero_in_corner)
+        if (
+            filter is None
+            and jnp.issubdtype(padded_real_voxel_grid.dtype, jnp.inexact)
+            and all(s % 2 == 0 for s in padded_shape)
+        ):
+            # ... for even grids, the real-space ifftshift and fourier-space
+            # fftshift are each a modulation by a checkerboard of signs. Store
+            # the potential grid with the zero frequency component in the center
+            # without copying the volume for either shift
+            sign = int(np.prod([(-1) ** (s // 2) for s in padded_shape]))
+            fourier_voxel_grid = _multiply_by_checkerboard(
+                jnp.fft.fftn(_multiply_by_checkerboard(padded_real_voxel_grid)),
+                sign=sign,
+            )
+        else:
+            fourier_voxel_grid_with_zero_in_corner = (
+                fftn(padded_real_voxel_grid)
+                if filter is None
+                else filter(fftn(padded_real_voxel_grid))
+            )
+            # ... store the potential grid with the zero frequency component in
+            # the center
+            fourier_voxel_grid = jnp.fft.fftshift(
+                fourier_voxel_grid_with_zero_in_corner
+            )
         # ... create in-plane frequency slice on the half space
         frequency_slice = FrequencySlice(
             cast(tuple[int, int], padded_real_voxel_grid.shape[:-1]), half_space=False
@@ -429,6 +447,70 @@ class RealVoxelGridPotential(AbstractVoxelPotential, strict=True):
             **kwargs,
         )
 
+    @classmethod
+    def from_trajectory(
+        cls,
+        atom_positions: (
+            Float[Array, "n_frames n_atoms 3"] | Float[np.ndarray, "n_frames n_atoms 3"]
+        ),
+        atom_identities: Int[Array, " n_atoms"] | Int[np.ndarray, " n_atoms"],
+        voxel_size: Float[Array, ""] | Float[np.ndarray, ""] | float,
+        coordinate_grid_in_angstroms: CoordinateGrid,
+        form_factors: Optional[
+            Float[Array, "n_atoms n_form_factors"]
+            | Float[np.ndarray, "n_atoms n_form_factors"]
+        ] = None,
+        *,
+        batch_size: int = 8,
+        **kwargs: Any,
+    ) -> Self:
+        """Load a stack of `RealVoxelGridPotential`s from a trajectory of atom
+        positions, one for each frame.
+
+        The result is the same as `jax.vmap` over `RealVoxelGridPotential.from_atoms`,
+        but frames are computed in batches with `jax.lax.map`. This way, only
+        `batch_size` frames of intermediates are in memory at once.
+
+        !!! note
+            As with `jax.vmap`, every leaf of the returned potential has a
+            leading frame dimension. This includes the coordinate grid, which
+            is the same for every frame and is three times the size of the
+            voxel grid.
+
+        **Arguments:**
+
+        - `batch_size`: The number of frames to compute at once.
+        - `**kwargs`: Passed to `RealVoxelGridPotential.from_real_voxel_grid`
+        """
+        atom_positions = jnp.asarray(atom_positions)
+        n_frames = atom_positions.shape[0]
+        n_batches = -(-n_frames // batch_size)
+        # Pad the trajectory so that it evenly splits into batches
+        padded_atom_positions = jnp.pad(
+            atom_positions, ((0, n_batches * batch_size - n_frames), (0, 0), (0, 0))
+        )
+        make_batch_of_potentials = jax.vmap(
+            lambda positions: cls.from_atoms(
+                positions,
+                atom_identities,
+                voxel_size,
+                coordinate_grid_in_angstroms,
+                form_factors,
+                **kwargs,
+            )
+        )
+        batched_potentials = jax.lax.map(
+            make_batch_of_potentials,
+            padded_atom_positions.reshape(
+                (n_batches, batch_size, *atom_positions.shape[1:])
+            ),
+        )
+        # ... flatten the batches and remove the padded frames
+        return jax.tree_util.tree_map(
+            lambda x: x.reshape((n_batches * batch_size, *x.shape[2:]))[:n_frames],
+            batched_potentials,
+        )
+
 
 class RealVoxelCloudPotential(AbstractVoxelPotential, strict=True):
     """Abstraction of a 3D electron scattering potential voxel point cloud.
@@ -561,6 +643,23 @@ class RealVoxelCloudPotential(AbstractVoxelPotential, strict=True):
         )
 
 
+@partial(jax.jit, static_argnames=["sign"])
+def _multiply_by_checkerboard(
+    voxel_grid: Inexact[Array, "z_dim y_dim x_dim"], sign: int = 1
+) -> Inexact[Array, "z_dim y_dim x_dim"]:
+    """Multiply a grid by alternating signs, $\\pm (-1)^{i + j + k}$.
+
+    The signs are one-dimensional vectors along each axis, broadcast
+    against the grid in its own precision.
+    """
+    dtype = jnp.finfo(voxel_grid.dtype).dtype
+    for axis, size in enumerate(voxel_grid.shape):
+        signs = np.where(np.arange(size) % 2 == 0, 1, -1) * (sign if axis == 0 else 1)
+        broadcast_shape = [-1 if i == axis else 1 for i in range(voxel_grid.ndim)]
+        voxel_grid = voxel_grid * jnp.asarray(signs.reshape(broadcast_shape), dtype)
+    return voxel_grid
+
+
 def evaluate_3d_real_space_gaussian(
     coordinate_grid_in_angstroms: Float[Array, "z_dim y_dim x_dim 3"],
     atom_position: Float[Array, "3"],
@@ -583,12 +682,12 @@ def evaluate_3d_real_space_gaussian(
 
     The potential of the gaussian on the grid.
     """
-    b_inverse = 4.0 * jnp.pi / b
-    sq_distances = jnp.sum(
-        b_inverse * (coordinate_grid_in_angstroms - atom_position) ** 2, axis=-1
+    return evaluate_3d_atom_potential(
+        coordinate_grid_in_angstroms,
+        atom_position,
+        jnp.atleast_1d(a),
+        jnp.atleast_1d(b),
     )
-    return (4 * jnp.pi *
-            jnp.exp(-jnp.pi * sq_distances) * a * b_inverse ** (3.0 / 2.0))
 
 
 def evaluate_3d_atom_potential(
@@ -610,19 +709,25 @@ def evaluate_3d_atom_potential(
 
     The potential of the atom evaluated on the grid.
     """
-    eval_fxn = jax.vmap(evaluate_3d_real_space_gaussian, in_axes=(None, None, 0, 0))
+    # Compute the squared distance to the atom once, and share it
+    # between all of its gaussians
+    b_inverse = 4.0 * jnp.pi / atomic_bs
+    sq_distances = jnp.sum((coordinate_grid_in_angstroms - atom_position) ** 2, axis=-1)
     return jnp.sum(
-        eval_fxn(coordinate_grid_in_angstroms, atom_position, atomic_as, atomic_bs),
+        (4 * jnp.pi * atomic_as * b_inverse ** (3.0 / 2.0))[:, None, None, None]
+        * jnp.exp(-jnp.pi * b_inverse[:, None, None, None] * sq_distances),
         axis=0,
     )
 
 
-@jax.jit
+@partial(jax.jit, static_argnames=["mixed_precision"])
 def build_real_space_voxels_from_atoms(
     atom_positions: Float[Array, "n_atoms 3"],
     ff_a: Float[Array, "n_atoms n_form_factors"],
     ff_b: Float[Array, "n_atoms n_form_factors"],
     coordinate_grid_in_angstroms: Float[Array, "dim dim dim 3"],
+    *,
+    mixed_precision: bool = False,
 ) -> Float[Array, "dim dim dim"]:
     """
     Build a voxel representation of an atomic model.
@@ -633,12 +738,27 @@ def build_real_space_voxels_from_atoms(
     - `ff_a`: Intensity values for each Gaussian in the atom
     - `ff_b` : The inverse scale factors for each Gaussian in the atom
     - `coordinate_grid` : The coordinates of each voxel in the grid.
+    - `mixed_precision` : If `True`, evaluate and accumulate the gaussians
+                          in `float32`, even if 64-bit precision is enabled.
+                          The result is returned in the promoted precision
+                          of the inputs.
 
     **Returns:**
 
     The voxel representation of the atomic model.
     """
-    voxel_grid_buffer = jnp.zeros(coordinate_grid_in_angstroms.shape[:-1])
+    output_dtype = jnp.result_type(
+        atom_positions, ff_a, ff_b, coordinate_grid_in_angstroms
+    )
+    if mixed_precision:
+        atom_positions, ff_a, ff_b, coordinate_grid_in_angstroms = (
+            jnp.asarray(x, dtype=jnp.float32)
+            for x in (atom_positions, ff_a, ff_b, coordinate_grid_in_angstroms)
+        )
+    voxel_grid_buffer = jnp.zeros(
+        coordinate_grid_in_angstroms.shape[:-1],
+        dtype=jnp.result_type(atom_positions, ff_a, ff_b, coordinate_grid_in_angstroms),
+    )
 
     def add_gaussian_to_potential(i, potential):
         potential += evaluate_3d_atom_potential(
@@ -650,4 +770,4 @@ def build_real_space_voxels_from_atoms(
         0, atom_positions.shape[0], add_gaussian_to_potential, voxel_grid_buffer
     )
 
-    return voxel_grid
+    return voxel_grid.astype(output_dtype)
@@ -0,0 +1,51 @@
+import jax
+import jax.numpy as jnp
+import numpy as np
+import pytest
+
+from cryojax.coordinates import make_coordinates
+from cryojax.image import radial_average
+
+
+jax.config.update("jax_enable_x64", True)
+
+
+def _radial_average_with_bincount(image, radial_grid, bins, interpolation_mode):
+    # Reference implementation, with one bincount for the sums and one
+    # for the counts
+    digitized_radial_grid = jnp.digitize(radial_grid, bins, right=True)
+    average_as_profile = jnp.bincount(
+        digitized_radial_grid.ravel(), weights=image.ravel(), length=bins.size
+    ) / jnp.bincount(digitized_radial_grid.ravel(), length=bins.size)
+    if interpolation_mode == "nearest":
+        average_as_grid = jnp.take(
+            average_as_profile, digitized_radial_grid, mode="clip"
+        )
+    else:
+        average_as_grid = jnp.interp(
+            radial_grid.ravel(), bins, average_as_profile
+        ).reshape(radial_grid.shape)
+    return average_as_profile, average_as_grid
+
+
+@pytest.mark.parametrize("shape", [(32, 33), (16, 17, 18)])
+@pytest.mark.parametrize("is_complex", [False, True])
+@pytest.mark.parametrize("interpolation_mode", ["nearest", "linear"])
+def test_radial_average_agrees_with_bincount(shape, is_complex, interpolation_mode):
+    key1, key2 = jax.random.split(jax.random.PRNGKey(0))
+    image = jax.random.normal(key1, shape)
+    if is_complex:
+        image = image + 1j * jax.random.normal(key2, shape)
+    radial_grid = jnp.linalg.norm(make_coordinates(shape), axis=-1)
+    # The largest radii fall past the last bin, in the overflow bin
+    bins = jnp.linspace(0.0, 0.8 * jnp.max(radial_grid), 10)
+    profile = radial_average(image, radial_grid, bins)
+    profile_with_grid, grid = radial_average(
+        image, radial_grid, bins, to_grid=True, interpolation_mode=interpolation_mode
+    )
+    reference_profile, reference_grid = _radial_average_with_bincount(
+        image, radial_grid, bins, interpolation_mode
+    )
+    np.testing.assert_array_equal(profile, reference_profile)
+    np.testing.assert_array_equal(profile_with_grid, reference_profile)
+    np.testing.assert_array_equal(grid, reference_grid)
@@ -3,7 +3,7 @@ import jax.numpy as jnp
 import numpy as np
 import pytest
 
-from cryojax.image import fftn, ifftn
+from cryojax.image import fftn, ifftn, irfftn, rfftn
 
 
 jax.config.update("jax_enable_x64", True)
@@ -35,3 +35,54 @@ def test_fft(model, request):
     np.testing.assert_allclose(
         fftn(image)[0, 0], fftn(ifftn(fftn(image)).real)[0, 0], atol=1e-12
     )
+
+
+@pytest.mark.parametrize(
+    "shape, axes",
+    [
+        ((32, 32), None),
+        ((33, 33), None),
+        ((32, 33), None),
+        ((33, 32), None),
+        ((16, 17, 18), None),
+        ((17, 16, 15), None),
+        ((4, 16, 17), (1, 2)),
+        ((4, 17, 16), (-2, -1)),
+        ((17, 16, 5), (0, 1)),
+    ],
+)
+def test_rfftn_agrees_with_shifted_fft(shape, axes):
+    real_space_axes = tuple(range(len(shape))) if axes is None else axes
+    s = tuple(shape[axis] for axis in real_space_axes)
+    x = jnp.asarray(np.random.randn(*shape))
+    # Compare to shifting in real space
+    ft = rfftn(x, axes=axes)
+    expected_ft = jnp.fft.rfftn(jnp.fft.ifftshift(x, axes=axes), axes=axes)
+    np.testing.assert_allclose(ft, expected_ft, atol=1e-10)
+    ift = irfftn(expected_ft, s=s, axes=axes)
+    expected_ift = jnp.fft.fftshift(
+        jnp.fft.irfftn(expected_ft, s=s, axes=axes), axes=axes
+    )
+    np.testing.assert_allclose(ift, expected_ift, atol=1e-10)
+    np.testing.assert_allclose(ift, x, atol=1e-10)
+    # ... without passing the real-space shape, if the last axis is even
+    if s[-1] % 2 == 0:
+        np.testing.assert_allclose(irfftn(expected_ft, axes=axes), x, atol=1e-10)
+
+
+@pytest.mark.parametrize(
+    "shape, padded_shape", [((16, 16), (20, 24)), ((15, 17), (21, 18))]
+)
+def test_rfftn_and_irfftn_with_padding(shape, padded_shape):
+    x = jnp.asarray(np.random.randn(*shape))
+    np.testing.assert_allclose(
+        rfftn(x, s=padded_shape),
+        jnp.fft.rfftn(jnp.fft.ifftshift(x), s=padded_shape),
+        atol=1e-10,
+    )
+    ft = jnp.fft.rfftn(jnp.fft.ifftshift(x))
+    np.testing.assert_allclose(
+        irfftn(ft, s=padded_shape),
+        jnp.fft.fftshift(jnp.fft.irfftn(ft, s=padded_shape)),
+        atol=1e-10,
+    )
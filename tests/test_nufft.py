@@ -0,0 +1,36 @@
+import jax
+import jax.numpy as jnp
+import numpy as np
+import pytest
+
+import cryojax.simulator as cs
+
+
+jax.config.update("jax_enable_x64", True)
+
+pytest.importorskip("jax_finufft")
+
+
+@pytest.mark.parametrize("shape", [(16, 16), (16, 17), (17, 16)])
+@pytest.mark.parametrize("is_coordinate_list_shared", [False, True])
+def test_batched_nufft_matches_individual_calls(shape, is_coordinate_list_shared):
+    n_batch, n_points = 3, 50
+    key1, key2 = jax.random.split(jax.random.PRNGKey(0))
+    weights = jax.random.normal(key1, (n_batch, n_points))
+    coordinate_list = jax.random.uniform(
+        key2, (n_batch, n_points, 3), minval=-8.0, maxval=8.0
+    )
+    if is_coordinate_list_shared:
+        coordinate_list = coordinate_list[0]
+        get_coordinate_list = lambda i: coordinate_list
+    else:
+        get_coordinate_list = lambda i: coordinate_list[i]
+    # Compute the batch in one call and compare to one call per item
+    batched_projection = cs.project_with_nufft(weights, coordinate_list, shape)
+    projections = jnp.stack(
+        [
+            cs.project_with_nufft(weights[i], get_coordinate_list(i), shape)
+            for i in range(n_batch)
+        ]
+    )
+    np.testing.assert_allclose(batched_projection, projections)
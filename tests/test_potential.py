@@ -4,6 +4,8 @@ import equinox as eqx
 import jax
 import jax.numpy as jnp
 import jax.tree_util as jtu
+import numpy as np
+import pytest
 from jaxtyping import Array, Float
 
 import cryojax.simulator as cs
@@ -14,6 +16,7 @@ from cryojax.coordinates import (
     CoordinateList,
     FrequencySlice,
 )
+from cryojax.image import fftn
 
 
 def test_voxel_electron_potential_loaders():
@@ -48,6 +51,23 @@ def test_voxel_electron_potential_loaders():
     )
 
 
+@pytest.mark.parametrize("shape", [(32, 32, 32), (30, 30, 30), (31, 31, 31)])
+@pytest.mark.parametrize("dtype", [jnp.float32, jnp.float64])
+def test_fourier_voxel_grid_agrees_with_shifted_fft(shape, dtype):
+    real_voxel_grid = jax.random.normal(jax.random.PRNGKey(0), shape, dtype=dtype)
+    fourier_potential = cs.FourierVoxelGridPotential.from_real_voxel_grid(
+        real_voxel_grid, voxel_size=1.0
+    )
+    fourier_voxel_grid = fourier_potential.fourier_voxel_grid
+    expected_fourier_voxel_grid = jnp.fft.fftshift(fftn(real_voxel_grid))
+    assert fourier_voxel_grid.dtype == expected_fourier_voxel_grid.dtype
+    np.testing.assert_allclose(
+        fourier_voxel_grid,
+        expected_fourier_voxel_grid,
+        atol=1e-3 if dtype == jnp.float32 else 1e-10,
+    )
+
+
 def test_electron_potential_vmap(potential, integrator, config):
     filter_spec = jtu.tree_map(
         lambda x: not isinstance(x, AbstractCoordinates),
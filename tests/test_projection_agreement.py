@@ -31,3 +31,22 @@ def test_even_vs_odd_image_shape(shape, sample_mrc_path, pixel_size):
         crop_to_shape(pipeline_test.render(), control_shape),
         pipeline_control.render(),
     )
+
+
+def test_extract_slice_on_even_grid():
+    n_voxels = 32
+    real_voxel_grid = jax.random.normal(jax.random.PRNGKey(0), 3 * (n_voxels,))
+    potential = cs.FourierVoxelGridPotential.from_real_voxel_grid(real_voxel_grid, 1.0)
+    fourier_voxel_grid = potential.fourier_voxel_grid
+    projection = cs.extract_slice(
+        fourier_voxel_grid,
+        potential.wrapped_frequency_slice_in_pixels.get(),
+    )
+    # Without a rotation, the slice is the central plane of the voxel grid
+    N = fourier_voxel_grid.shape[0]
+    expected_projection = np.fft.ifftshift(
+        np.pad(fourier_voxel_grid[N // 2, :, N // 2 :], ((0, 0), (0, 1))), axes=(0,)
+    )
+    expected_projection[N // 2, :] = 0.0
+    assert projection.shape == (N, N // 2 + 1)
+    np.testing.assert_allclose(projection, expected_projection, atol=1e-12)
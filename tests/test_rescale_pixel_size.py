@@ -0,0 +1,35 @@
+import jax
+import jax.numpy as jnp
+import numpy as np
+import pytest
+from jax.image import scale_and_translate
+
+from cryojax.image import rescale_pixel_size
+
+
+jax.config.update("jax_enable_x64", True)
+
+
+@pytest.mark.parametrize("method", ["lanczos3", "lanczos5"])
+@pytest.mark.parametrize("shape", [(65, 66), (64, 64)])
+@pytest.mark.parametrize("new_pixel_size", [0.7, 1.0, 1.3])
+def test_lanczos_taps_agree_with_scale_and_translate(method, shape, new_pixel_size):
+    image = jnp.asarray(np.random.randn(*shape))
+    current_pixel_size, new_pixel_size = jnp.asarray(1.0), jnp.asarray(new_pixel_size)
+    rescaled_image = rescale_pixel_size(
+        image, current_pixel_size, new_pixel_size, method=method
+    )
+    # Compare to the dense resampling matrices in jax.image
+    scaling = jnp.full((2,), current_pixel_size / new_pixel_size)
+    translation = (1 - scaling) * jnp.asarray([shape[0] // 2, shape[1] // 2])
+    reference_image = scale_and_translate(
+        image,
+        shape,
+        (0, 1),
+        scaling,
+        translation,
+        method,
+        antialias=False,
+        precision=jax.lax.Precision.HIGHEST,
+    )
+    np.testing.assert_allclose(rescaled_image, reference_image, atol=1e-10)
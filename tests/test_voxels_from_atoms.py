@@ -1,4 +1,3 @@
-import itertools
 import jax
 import jax.numpy as jnp
 import numpy as np
@@ -97,6 +96,44 @@ class TestBuildRealSpaceVoxelsFromAtoms:
 
         integral = jnp.sum(real_voxel_grid) * voxel_size**3
         assert jnp.isclose(integral, jnp.sum(ff_a) * 4 * jnp.pi)
+
+    def test_mixed_precision_agrees(self, toy_gaussian_cloud):
+        """
+        Test that evaluating the potential in float32 agrees with full precision.
+        """
+        (
+            atom_positions,
+            ff_a,
+            ff_b,
+            n_voxels_per_side,
+            voxel_size,
+        ) = toy_gaussian_cloud
+        coordinate_grid = CoordinateGrid(n_voxels_per_side, voxel_size)
+
+        # Build the potential in full and mixed precision
+        real_voxel_grid = build_real_space_voxels_from_atoms(
+            atom_positions, ff_a, ff_b, coordinate_grid.get()
+        )
+        mixed_precision_real_voxel_grid = build_real_space_voxels_from_atoms(
+            atom_positions, ff_a, ff_b, coordinate_grid.get(), mixed_precision=True
+        )
+
+        assert mixed_precision_real_voxel_grid.dtype == real_voxel_grid.dtype
+        np.testing.assert_allclose(
+            mixed_precision_real_voxel_grid,
+            real_voxel_grid,
+            atol=1e-5 * jnp.max(real_voxel_grid),
+        )
+        # Mixing a float32 grid with float64 atoms promotes to float64
+        float32_grid_real_voxel_grid = build_real_space_voxels_from_atoms(
+            atom_positions, ff_a, ff_b, coordinate_grid.get().astype(jnp.float32)
+        )
+        assert float32_grid_real_voxel_grid.dtype == real_voxel_grid.dtype
+        np.testing.assert_allclose(
+            float32_grid_real_voxel_grid,
+            real_voxel_grid,
+            atol=1e-5 * jnp.max(real_voxel_grid),
+        )
         
     def test_fourier_transform(self, toy_gaussian_cloud):
         (
@@ -115,41 +152,42 @@ class TestBuildRealSpaceVoxelsFromAtoms:
         )
         fourier_voxel_grid = fourier_potential.fourier_voxel_grid
         bin_size = 1 / (voxel_size) / n_voxels_per_side[0]
-        num_atoms = atom_positions.shape[0]
 
-        translational_phase_factor = lambda i, j, k, atom_position: jnp.exp(
+        # Verify generated fourier_voxel_grid agrees with scattering equation in Peng.
+        # Check up to 1/4 Nyquist Frequency in each axis.
+        frequency_array = jnp.stack(
+            jnp.meshgrid(*(3 * [jnp.arange(64, 80)]), indexing="ij"), axis=-1
+        ).reshape(-1, 3)
+        # ... compute the predicted values for all frequencies and atoms at once
+        frequencies = frequency_array.astype(float) - 64
+        translational_phase_factor = jnp.exp(
             -1j
             * 2
             * jnp.pi
-            * jnp.dot(atom_position, jnp.array([i - 64, j - 64, k - 64]))
+            * (frequencies @ atom_positions.T)
             / (n_voxels_per_side[0] * voxel_size)
         )
-        # Verify generated fourier_voxel_grid agrees with scattering equation in Peng.
-        # Check up to 1/4 Nyquist Frequency in each axis.
-        frequency_array = np.fromiter(
-            itertools.product(np.arange(64, 80), repeat=3), "i,i,i"
-        ).view(("i", 3))
-        for frequency in frequency_array:
-            [i, j, k] = frequency
-            predicted_value = 0
-            frequency_magnitude = np.sqrt((64 - i) ** 2 + (64 - j) ** 2 + (64 - k) ** 2)
-            for atom_index in range(0, num_atoms):
-                atom_contribution = jnp.sum(
-                    ff_a[atom_index]
-                    * 4
-                    * jnp.pi
-                    * (voxel_size) ** -3
-                    * jnp.exp(
-                        -ff_b[atom_index]
-                        * ((1 / 2) * bin_size * frequency_magnitude) ** 2
-                    )
-                    * translational_phase_factor(i, j, k, atom_positions[atom_index])
-                )
-
-                predicted_value = predicted_value + atom_contribution
-
-            fourier_grid_value = fourier_voxel_grid[k][j][i]
-            assert jnp.isclose((predicted_value), (fourier_grid_value), rtol=1e-4)
+        frequency_magnitude_squared = jnp.sum(frequencies**2, axis=1)
+        atom_amplitude = jnp.sum(
+            ff_a[None, :, :]
+            * 4
+            * jnp.pi
+            * (voxel_size) ** -3
+            * jnp.exp(
+                -ff_b[None, :, :]
+                * ((1 / 2) * bin_size) ** 2
+                * frequency_magnitude_squared[:, None, None]
+            ),
+            axis=-1,
+        )
+        predicted_values = jnp.sum(atom_amplitude * translational_phase_factor, axis=-1)
+        fourier_grid_values = fourier_voxel_grid[
+            frequency_array[:, 2], frequency_array[:, 1], frequency_array[:, 0]
+        ]
+        np.testing.assert_allclose(
+            predicted_values, fourier_grid_values, rtol=1e-4, atol=1e-8
+        )
+
 
 class TestBuildVoxelsFromTrajectories:
     def test_indexing_matches_individual_calls(self, toy_gaussian_cloud):
@@ -189,3 +227,83 @@ class TestBuildVoxelsFromTrajectories:
         np.testing.assert_allclose(
             traj_voxels.real_voxel_grid[1], voxel2.real_voxel_grid, atol=1e-12
         )
+
+    @pytest.mark.skipif(jax.device_count() < 2, reason="Requires multiple devices")
+    def test_pmap_over_devices_matches_vmap(self, toy_gaussian_cloud):
+        (
+            atom_positions,
+            ff_a,
+            ff_b,
+            n_voxels_per_side,
+            voxel_size,
+        ) = toy_gaussian_cloud
+        n_devices = jax.device_count()
+        n_frames_per_device = 2
+        traj = jnp.stack(
+            [atom_positions + 0.1 * i for i in range(n_devices * n_frames_per_device)],
+            axis=0,
+        )
+
+        coordinate_grid = CoordinateGrid(n_voxels_per_side, voxel_size)
+        elements = jnp.array([1, 1, 2, 6])
+
+        make_voxel_grid_ensemble = jax.vmap(
+            RealVoxelGridPotential.from_atoms, in_axes=[0, None, None, None]
+        )
+        traj_voxels = make_voxel_grid_ensemble(
+            traj, elements, voxel_size, coordinate_grid
+        )
+        # Split the frames across devices, and vmap over frames on each device
+        make_voxel_grid_ensemble_across_devices = jax.pmap(
+            make_voxel_grid_ensemble, in_axes=(0, None, None, None)
+        )
+        sharded_traj_voxels = make_voxel_grid_ensemble_across_devices(
+            traj.reshape((n_devices, n_frames_per_device, *traj.shape[1:])),
+            elements,
+            voxel_size,
+            coordinate_grid,
+        )
+
+        np.testing.assert_allclose(
+            sharded_traj_voxels.real_voxel_grid.reshape(
+                traj_voxels.real_voxel_grid.shape
+            ),
+            traj_voxels.real_voxel_grid,
+            atol=1e-12,
+        )
+
+    def test_batched_trajectory_matches_vmap(self, toy_gaussian_cloud):
+        (
+            atom_positions,
+            ff_a,
+            ff_b,
+            n_voxels_per_side,
+            voxel_size,
+        ) = toy_gaussian_cloud
+        traj = jnp.stack(
+            [atom_positions, atom_positions + 1.0, atom_positions - 1.0], axis=0
+        )
+
+        coordinate_grid = CoordinateGrid(n_voxels_per_side, voxel_size)
+        elements = jnp.array([1, 1, 2, 6])
+
+        make_voxel_grid_ensemble = jax.vmap(
+            RealVoxelGridPotential.from_atoms, in_axes=[0, None, None, None]
+        )
+        traj_voxels = make_voxel_grid_ensemble(
+            traj, elements, voxel_size, coordinate_grid
+        )
+        # Use a batch size that does not evenly divide the number of frames
+        batched_traj_voxels = RealVoxelGridPotential.from_trajectory(
+            traj, elements, voxel_size, coordinate_grid, batch_size=2
+        )
+
+        np.testing.assert_allclose(
+            batched_traj_voxels.real_voxel_grid,
+            traj_voxels.real_voxel_grid,
+            atol=1e-12,
+        )
+        np.testing.assert_allclose(
+            batched_traj_voxels.wrapped_coordinate_grid_in_pixels.get(),
+            traj_voxels.wrapped_coordinate_grid_in_pixels.get(),
+        )